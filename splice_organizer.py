@@ -5,21 +5,48 @@ Watches Splice folder and creates organized symlinks for easier browsing in Able
 """
 
 import argparse
+import functools
 import hashlib
 import json
 import logging
+import os
+import queue
 import re
+import signal
+import sqlite3
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import PatternMatchingEventHandler
+
+# Optional pattern-matching accelerators; without them the re module is used
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Configuration
 SPLICE_PACKS_DIR = Path.home() / "Splice" / "sounds" / "packs"
 ORGANIZED_DIR = Path.home() / "Splice-Organized"
+STATE_DB_FILE = ORGANIZED_DIR / ".organizer_state.db"
+STATE_SAVE_INTERVAL = 500  # Files processed between state commits during a sync
+# Legacy JSON state, imported into the database on first run
 STATE_FILE = ORGANIZED_DIR / ".organizer_state.json"
+SYNC_WORKERS = 8  # Threads linking files in parallel during a sync
+SYNC_CHUNK_SIZE = 64  # Files handed to a sync thread at a time
+EVENT_BATCH_DELAY = 0.2  # Seconds without new watch events before a batch is processed
+EVENT_BATCH_MAX = 500  # Watch events handled (and committed) together at most
 LOG_FILE = ORGANIZED_DIR / "organizer.log"
 
 # Categorization patterns - using (?:^|[\s_/]) as word boundary to match underscores
@@ -138,19 +165,359 @@ GENRE_CATEGORIES = {
     },
 }
 
+
+def _merge_patterns(patterns: list) -> re.Pattern:
+    """Fuse a list of patterns into one alternation so a single scan tests them all.
+
+    Patterns are lowercase and matched against lowercased text, so no IGNORECASE.
+    """
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+# Plain-text pattern shapes that can be tested without the regex engine:
+# a word between the (?:^|[\s_/]) / (?:[\s_/]|$) boundaries (optionally
+# plural), a word prefix after the start boundary, or a bare literal
+_WORD_PATTERN_RE = re.compile(r'\(\?:\^\|\[\\s_/\]\)([a-z0-9&]+)(s\?)?(\(\?:\[\\s_/\]\|\$\))?')
+_LITERAL_PATTERN_RE = re.compile(r'[a-z0-9&]+')
+_TOKEN_SEP_RE = re.compile(r'[\s_/]')
+
+
+# Pieces of a pattern that are not guaranteed literal text: character classes,
+# groups, escapes, anything made optional by ? or *, and the boundary wrappers
+_NON_LITERAL_RE = re.compile(r'\(\?:\^\|\[\\s_/\]\)|\(\?:\[\\s_/\]\|\$\)'
+                             r'|\[[^\]]*\][?*]?|\([^)]*\)[?*]?|\\.|.[?*]')
+
+
+def _required_literal(pattern: str) -> str:
+    """Return the longest literal substring every match of `pattern` must contain.
+
+    Returns '' when no such literal can be read off the pattern, in which case
+    the pattern always needs a full regex check.
+    """
+    fragments = _NON_LITERAL_RE.split(pattern)
+    if any(re.search(r'[.^$*+?{}\[\]\\|()]', f) for f in fragments):
+        return ''
+    return max(fragments, key=len).lower()
+
+
+class _KeyPatterns(NamedTuple):
+    """One key's patterns, split by how cheaply they can be tested."""
+    key: object
+    words: frozenset  # Whole tokens
+    prefixes: tuple  # Token prefixes
+    literals: tuple  # Substrings anywhere in the text
+    regex: Optional[re.Pattern]  # Everything else, fused
+    regex_literals: tuple  # One of these must be in the text for the regex to match; () if unknown
+
+
+def _split_patterns(key, patterns: list) -> _KeyPatterns:
+    words, prefixes, literals, rest = set(), [], [], []
+    for pattern in patterns:
+        word = _WORD_PATTERN_RE.fullmatch(pattern)
+        if word and word.group(3):
+            words.add(word.group(1))
+            if word.group(2):
+                words.add(word.group(1) + 's')
+        elif word:
+            prefixes.append(word.group(1))  # A trailing 's?' can't change a prefix match
+        elif _LITERAL_PATTERN_RE.fullmatch(pattern):
+            literals.append(pattern)
+        else:
+            rest.append(pattern)
+    regex_literals = {_required_literal(pattern) for pattern in rest}
+    if '' in regex_literals:
+        regex_literals = set()  # A pattern without a literal can match anything
+    return _KeyPatterns(key, frozenset(words), tuple(prefixes), tuple(literals),
+                        _merge_patterns(rest) if rest else None, tuple(regex_literals))
+
+
+class _RegexMatcher:
+    """Match text against {key: [patterns]}.
+
+    Word and literal patterns become set lookups and substring tests on the
+    text split at whitespace, underscores and slashes; only the rest go
+    through a fused regex per key, and only when the text contains one of
+    the literals those patterns require. Expects lowercased text, as produced by
+    the callers in SampleOrganizer.
+    """
+
+    def __init__(self, named_patterns: dict):
+        self.patterns = [_split_patterns(key, pats) for key, pats in named_patterns.items()]
+        self.tokenized = any(p.words or p.prefixes for p in self.patterns)
+
+    def _tokens(self, text: str):
+        return set(_TOKEN_SEP_RE.split(text)) if self.tokenized else ()
+
+    def _matches(self, key_id: int, text: str, tokens) -> bool:
+        _, words, prefixes, literals, regex, regex_literals = self.patterns[key_id]
+        if words and not words.isdisjoint(tokens):
+            return True
+        if prefixes and any(token.startswith(prefixes) for token in tokens):
+            return True
+        for literal in literals:
+            if literal in text:
+                return True
+        if regex is None:
+            return False
+        # Substring tests are far cheaper than a regex scan, so rule the regex out first
+        if regex_literals:
+            for literal in regex_literals:
+                if literal in text:
+                    break
+            else:
+                return False
+        return regex.search(text) is not None
+
+    def first(self, text: str):
+        """Return the first key (in dict order) with a matching pattern, or None."""
+        tokens = self._tokens(text)
+        for key_id, entry in enumerate(self.patterns):
+            if self._matches(key_id, text, tokens):
+                return entry.key
+        return None
+
+    def all(self, text: str) -> list:
+        """Return every key with a matching pattern, in dict order."""
+        tokens = self._tokens(text)
+        return [entry.key for key_id, entry in enumerate(self.patterns)
+                if self._matches(key_id, text, tokens)]
+
+
+class _AhoCorasickMatcher(_RegexMatcher):
+    """Prefilter keys on required literals with one Aho-Corasick pass, then confirm them."""
+
+    def __init__(self, named_patterns: dict):
+        super().__init__(named_patterns)
+        self.always = set()  # Keys with a pattern that has no usable literal
+        literal_keys = {}
+        for key_id, patterns in enumerate(named_patterns.values()):
+            for pattern in patterns:
+                literal = _required_literal(pattern)
+                if literal:
+                    literal_keys.setdefault(literal, set()).add(key_id)
+                else:
+                    self.always.add(key_id)
+        self.automaton = ahocorasick.Automaton()
+        for literal, key_ids in literal_keys.items():
+            self.automaton.add_word(literal, frozenset(key_ids))
+        self.automaton.make_automaton()
+
+    def _candidates(self, text: str) -> list:
+        key_ids = set(self.always)
+        for _, hit_ids in self.automaton.iter(text):
+            key_ids |= hit_ids
+        return sorted(key_ids)
+
+    def first(self, text: str):
+        """Return the first key (in dict order) with a matching pattern, or None."""
+        candidates = self._candidates(text)
+        tokens = self._tokens(text) if candidates else ()
+        for key_id in candidates:
+            if self._matches(key_id, text, tokens):
+                return self.patterns[key_id].key
+        return None
+
+    def all(self, text: str) -> list:
+        """Return every key with a matching pattern, in dict order."""
+        candidates = self._candidates(text)
+        tokens = self._tokens(text) if candidates else ()
+        return [self.patterns[key_id].key for key_id in candidates
+                if self._matches(key_id, text, tokens)]
+
+
+class _HyperscanMatcher:
+    """Match text against {key: [patterns]} with a single Hyperscan database scan.
+
+    Expects lowercased text, like the other matchers. Patterns are compiled in
+    UTF-8/Unicode mode so whitespace and word classes match what they do in re;
+    text that isn't valid UTF-8 (undecodable filename bytes) goes to re instead.
+    """
+
+    def __init__(self, named_patterns: dict):
+        self.fallback = _RegexMatcher(named_patterns)
+        self.keys = list(named_patterns)
+        expressions = []
+        ids = []
+        for key_id, patterns in enumerate(named_patterns.values()):
+            for pattern in patterns:
+                expressions.append(pattern.encode())
+                ids.append(key_id)
+        self.db = hyperscan.Database()
+        self.db.compile(expressions=expressions, ids=ids, elements=len(expressions),
+                        flags=hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        self._local = threading.local()  # Scratch space can't be shared by concurrent scans
+
+    def _scan(self, data: bytes) -> set:
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.db)
+        hits = set()
+        self.db.scan(data, scratch=scratch,
+                     match_event_handler=lambda key_id, start, end, flags, ctx: hits.add(key_id))
+        return hits
+
+    def first(self, text: str):
+        """Return the first key (in dict order) with a matching pattern, or None."""
+        try:
+            data = text.encode()
+        except UnicodeEncodeError:  # Lone surrogates from surrogateescape
+            return self.fallback.first(text)
+        hits = self._scan(data)
+        return self.keys[min(hits)] if hits else None
+
+    def all(self, text: str) -> list:
+        """Return every key with a matching pattern, in dict order."""
+        try:
+            data = text.encode()
+        except UnicodeEncodeError:  # Lone surrogates from surrogateescape
+            return self.fallback.all(text)
+        return [self.keys[key_id] for key_id in sorted(self._scan(data))]
+
+
+def _make_matcher(named_patterns: dict):
+    """Build the fastest available matcher for a {key: [patterns]} dict."""
+    if hyperscan is not None:
+        return _HyperscanMatcher(named_patterns)
+    if ahocorasick is not None:
+        return _AhoCorasickMatcher(named_patterns)
+    return _RegexMatcher(named_patterns)
+
+
+# Compiled once at import; the raw pattern dicts above stay the source of truth
+ONESHOT_MATCHER = _make_matcher(ONESHOT_CATEGORIES)
+LOOP_MATCHER = _make_matcher(LOOP_CATEGORIES)
+GENRE_MATCHER = _make_matcher({
+    (parent, genre): patterns
+    for parent, genres in GENRE_CATEGORIES.items()
+    for genre, patterns in genres.items()
+})
+
+# Folder names that mark a sample as a loop or a one-shot (matched on the lowercased path)
+LOOP_FOLDER_RE = re.compile(r'/(?:loops|loop|drum_loops|synth_loops|bass_loops|percussion_loops|'
+                            r'vocal_loops|fx_loops|melodic_loops|music_loops|hat_loops|kick_loops|'
+                            r'top_loops)/')
+ONESHOT_FOLDER_RE = re.compile(r'/(?:one_shots|one-shots|oneshots|one_shot|hits|drum_hits|samples|'
+                               r'drum_one_shots)/')
+
+# BPM at the start of a filename (e.g. 120_...) usually indicates a loop
+BPM_PREFIX_RE = re.compile(r'\d{2,3}_')
+
 logger = logging.getLogger(__name__)
 
 
+def _iter_wav_files(root: str):
+    """Yield the paths of all .wav files under root.
+
+    Same order as Path.rglob (a folder's files before its subfolders), but
+    DirEntry type info avoids extra stats and no Path objects are built.
+    """
+    # Explicit stack rather than recursion, so deep trees don't stack up generators
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        subdirs = []
+        try:
+            entries = os.scandir(folder)
+        except PermissionError:
+            # Skipped like Path.rglob does, rather than failing the whole scan
+            logger.warning(f"Skipped unreadable folder: {folder}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name[-4:].lower() == '.wav' and entry.is_file():
+                    # is_file() only stats symlinks, to drop dangling ones
+                    yield entry.path
+        stack.extend(reversed(subdirs))  # First subfolder is walked next
+
+
+# Sources all live under SPLICE_PACKS_DIR, so the pack folder sits at a fixed depth
+PACKS_PREFIX_PARTS = SPLICE_PACKS_DIR.parts
+
+
+class _SampleInfo(NamedTuple):
+    """Path pieces of a source file, split once and shared by the classifiers."""
+    source: str
+    name: str
+    path_lower: str
+    stem_lower: str
+    folders: tuple  # Parent folder names, outermost first (no root)
+    pack_parts: tuple  # Pack name and its immediate subfolder, when under SPLICE_PACKS_DIR
+
+
+# Work that depends only on a file's folder is cached per folder (here and in
+# SampleOrganizer._folder_search_text/_folder_genres): every file in a folder
+# shares the result, and syncs and pack downloads handle a folder's files together
+@functools.lru_cache(maxsize=4096)
+def _folder_parts(folder: str) -> tuple:
+    """Return (folder names, pack parts or None) for a folder."""
+    path = Path(folder)
+    parts = path.parts
+    depth = len(PACKS_PREFIX_PARTS)
+    pack_parts = parts[depth:depth + 2] if parts[:depth] == PACKS_PREFIX_PARTS else None
+    return (parts[1:] if path.anchor else parts), pack_parts
+
+
+def _sample_info(source: str) -> _SampleInfo:
+    folder, name = os.path.split(source)
+    folders, pack_parts = _folder_parts(folder)
+    path_lower = source.lower()
+    return _SampleInfo(
+        source=source,
+        name=name,
+        path_lower=path_lower,
+        stem_lower=os.path.splitext(os.path.basename(path_lower))[0],
+        folders=folders,
+        # A file directly in a pack (or packs) folder contributes its own name
+        pack_parts=(pack_parts + (name,))[:2] if pack_parts is not None else (),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _safe_pack_name(pack_name: str) -> str:
+    """Pack name as used in link names: word characters and dashes, at most 30 long."""
+    return re.sub(r'[^\w\-]', '_', pack_name)[:30]
+
+
+@functools.lru_cache(maxsize=1024)
+def _link_dirs(type_folder: str, category: str, genres: tuple) -> tuple:
+    """Folders a sample is linked into: All/, its category folder, then its genre folders."""
+    # Loops get their own instrument subfolder within each genre
+    instrument_folder = f"{category}_Loops" if type_folder == "Loops" else category
+    dirs = [ORGANIZED_DIR / "All", ORGANIZED_DIR / type_folder / category]
+    if genres:
+        dirs.extend(ORGANIZED_DIR / "Genres" / parent / genre / instrument_folder
+                    for parent, genre in genres)
+    else:
+        # No genre detected, put in Other
+        dirs.append(ORGANIZED_DIR / "Genres" / "Other" / instrument_folder)
+    return tuple(f"{d}{os.sep}" for d in dirs)
+
+
+def _link_paths(unique_name: str, type_folder: str, category: str, genres: list) -> list:
+    """Paths of every link for a sample, as strings, in the order of _link_dirs."""
+    # Few distinct folder sets exist, so the Path arithmetic is done once per set
+    dirs = _link_dirs(type_folder, category, tuple(map(tuple, genres)))
+    return [d + unique_name for d in dirs]
+
+
 class SampleOrganizer:
     """Core logic for categorizing and symlinking samples."""
 
+    _dirs_ready = False  # Output folder tree known to exist, shared by all instances
+
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
-        self.state = self._load_state()
+        self._lock = threading.Lock()
         self._ensure_directories()
+        self.conn = self._open_state()
 
     def _ensure_directories(self):
         """Create all required directories."""
+        if SampleOrganizer._dirs_ready:
+            return
+
         # Instrument categories for genre subfolders
         oneshot_cats = list(ONESHOT_CATEGORIES.keys()) + ["Other"]
         loop_cats = [f"{cat}_Loops" for cat in list(LOOP_CATEGORIES.keys()) + ["Other"]]
@@ -173,292 +540,439 @@ class SampleOrganizer:
             # Genres - Other (with instrument subfolders)
             *[ORGANIZED_DIR / "Genres" / "Other" / inst for inst in genre_instrument_cats],
         ]
-        for d in dirs:
-            d.mkdir(parents=True, exist_ok=True)
-
-    def _load_state(self) -> dict:
-        """Load previous state to track existing symlinks."""
+        # Folders are created in order, so if the last one exists the tree was
+        # built before; any folder removed since is recreated by _create_link
+        if not dirs[-1].is_dir():
+            for d in dirs:
+                d.mkdir(parents=True, exist_ok=True)
+        SampleOrganizer._dirs_ready = True
+
+    def _open_state(self) -> sqlite3.Connection:
+        """Open the state database that tracks how each source file was linked."""
+        if self.dry_run:
+            conn = self._copy_state()
+        else:
+            # Watch mode uses the connection from watchdog's thread; access is never concurrent
+            conn = sqlite3.connect(STATE_DB_FILE, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; fsync only at checkpoints
+        # Link paths aren't stored: they are rebuilt from the unique name and classification
+        conn.execute("CREATE TABLE IF NOT EXISTS files (source TEXT PRIMARY KEY, name TEXT NOT NULL, "
+                     "type TEXT, category TEXT, genres TEXT)")
         if STATE_FILE.exists():
+            self._import_legacy_state(conn)
+        return conn
+
+    @staticmethod
+    def _copy_state() -> sqlite3.Connection:
+        """In-memory copy of the state database, so a dry run never writes to or locks the real one."""
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        if STATE_DB_FILE.exists():
+            source = sqlite3.connect(f"{STATE_DB_FILE.as_uri()}?mode=ro", uri=True)
             try:
-                return json.loads(STATE_FILE.read_text())
-            except json.JSONDecodeError:
-                return {"files": {}}
-        return {"files": {}}
-
-    def _save_state(self):
-        """Persist state to disk."""
+                source.backup(conn)
+            finally:
+                source.close()
+        return conn
+
+    @staticmethod
+    def _state_row(source: str, links: list) -> Optional[tuple]:
+        """Build a (source, name, type, category, genres JSON) row from the paths of a file's links.
+
+        Returns None if the links don't show a category folder under ORGANIZED_DIR.
+        """
+        type_folder = category = None
+        genres = []
+        for link in links:
+            parts = Path(link).parts
+            try:
+                parts = parts[parts.index(ORGANIZED_DIR.name) + 1:]  # e.g. Loops/Bass/name.wav
+            except ValueError:
+                continue
+            if len(parts) > 2 and parts[0] in ('One_Shots', 'Loops'):
+                type_folder, category = parts[0], parts[1]
+            elif len(parts) > 3 and parts[0] == 'Genres' and parts[1] != 'Other':
+                genres.append((parts[1], parts[2]))
+        if type_folder is None:
+            return None
+        return source, Path(links[0]).name, type_folder, category, json.dumps(genres)
+
+    def _import_legacy_state(self, conn: sqlite3.Connection):
+        """Move records from the old JSON state file into the database."""
+        try:
+            files = json.loads(STATE_FILE.read_text())["files"]
+        except json.JSONDecodeError:
+            files = {}
+
+        rows = [self._state_row(source, links) for source, links in files.items() if links]
+        imported = [row for row in rows if row is not None]
+        conn.executemany("INSERT OR REPLACE INTO files (source, name, type, category, genres) "
+                         "VALUES (?, ?, ?, ?, ?)", imported)
+        if self.dry_run:
+            return
+        conn.commit()
+        logger.info(f"Imported {len(imported)} files from {STATE_FILE.name}")
+        if len(imported) < len(files):
+            # E.g. links made before ORGANIZED_DIR was changed; these files are linked again
+            logger.warning(f"Skipped {len(files) - len(imported)} files whose links are not under {ORGANIZED_DIR}")
+        STATE_FILE.unlink(missing_ok=True)
+
+    def save_state(self):
+        """Commit pending state changes to disk."""
         if not self.dry_run:
-            STATE_FILE.write_text(json.dumps(self.state, indent=2))
+            self.conn.commit()
+
+    def _is_processed(self, source_str: str) -> bool:
+        """Check whether links were already created for a source file."""
+        return self.conn.execute("SELECT 1 FROM files WHERE source = ?", (source_str,)).fetchone() is not None
+
+    def _get_links(self, source_str: str) -> Optional[list]:
+        """Return the link paths recorded for a source file, or None if it is unknown."""
+        row = self.conn.execute("SELECT name, type, category, genres FROM files WHERE source = ?",
+                                (source_str,)).fetchone()
+        if row is None:
+            return None
+        name, type_folder, category, genres = row
+        return _link_paths(name, type_folder, category, json.loads(genres))
 
     def process_file(self, source_path: Path) -> bool:
         """Process a single .wav file, creating symlinks."""
-        if source_path.suffix.lower() != '.wav':
+        source_str = str(source_path)
+        if not self._should_process(source_str):
             return False
 
-        if not source_path.exists():
+        info = _sample_info(source_str)
+        try:
+            unique_name = self._generate_unique_name(info)
+        except FileNotFoundError:
+            logger.warning(f"Skipped missing file: {source_path.name}")
+            return False
+        result = self._link_file(info, unique_name)
+        if result is None:
             return False
+        self._record_file(source_str, *result)
+        return True
 
-        source_str = str(source_path)
+    def _should_process(self, source_str: str) -> bool:
+        """Check that a path is a .wav file not processed yet.
 
-        # Skip if already processed
-        if source_str in self.state["files"]:
+        Existence isn't checked here; a missing file fails when it is linked.
+        """
+        if source_str[-4:].lower() != '.wav':
             return False
 
+        # Skip if already processed
+        return not self._is_processed(source_str)
+
+    def _link_file(self, info: _SampleInfo, unique_name: str) -> Optional[tuple]:
+        """Categorize a file and create its links without touching state.
+
+        Returns (unique name, type folder, category, genres), or None if the source
+        no longer exists. Safe to call from several threads at once.
+        """
+        source_str = info.source
+
         # Determine if loop or one-shot
-        is_loop = self._is_loop(source_str)
+        is_loop = self._is_loop(info)
 
         # Get category
-        category = self._categorize(source_str, is_loop)
+        category = self._categorize(info, is_loop)
 
         # Detect genres (can be multiple)
-        genres = self._detect_genres(source_str)
-
-        # Generate unique filename
-        unique_name = self._generate_unique_name(source_path)
+        genres = self._detect_genres(info)
 
+        type_folder = "Loops" if is_loop else "One_Shots"
         if self.dry_run:
-            type_folder = "Loops" if is_loop else "One_Shots"
-            logger.info(f"[DRY RUN] Would create:")
-            logger.info(f"  All/{unique_name}")
-            logger.info(f"  {type_folder}/{category}/{unique_name}")
-            if genres:
-                for parent, genre in genres:
-                    logger.info(f"  Genres/{parent}/{genre}/{unique_name}")
-            else:
-                logger.info(f"  Genres/Other/{unique_name}")
-            return True
-
-        # Create symlinks
-        symlinks_created = []
-
-        # 1. All/ folder
-        all_link = ORGANIZED_DIR / "All" / unique_name
-        self._create_link(source_path, all_link)
-        symlinks_created.append(str(all_link))
-
-        # 2. Categorized folder (One_Shots or Loops)
-        if is_loop:
-            cat_link = ORGANIZED_DIR / "Loops" / category / unique_name
-        else:
-            cat_link = ORGANIZED_DIR / "One_Shots" / category / unique_name
-
-        self._create_link(source_path, cat_link)
-        symlinks_created.append(str(cat_link))
-
-        # 3. Genre folders (can be multiple) - now with instrument subfolders
-        # Determine instrument subfolder name
-        if is_loop:
-            instrument_folder = f"{category}_Loops"
-        else:
-            instrument_folder = category
+            with self._lock:  # Keep each file's lines together when syncing in parallel
+                logger.info(f"[DRY RUN] Would create:")
+                logger.info(f"  All/{unique_name}")
+                logger.info(f"  {type_folder}/{category}/{unique_name}")
+                if genres:
+                    for parent, genre in genres:
+                        logger.info(f"  Genres/{parent}/{genre}/{unique_name}")
+                else:
+                    logger.info(f"  Genres/Other/{unique_name}")
+            return unique_name, type_folder, category, genres
+
+        # Create symlinks: All/ first, then the category and genre folders
+        all_link, *other_links = _link_paths(unique_name, type_folder, category, genres)
+        try:
+            self._create_link(source_str, all_link)
+        except FileNotFoundError:
+            # Source removed since it was found (or a dangling symlink)
+            logger.warning(f"Skipped missing file: {os.path.basename(source_str)}")
+            return None
+        for link in other_links:
+            self._create_link(source_str, link)
 
-        if genres:
-            for parent, genre in genres:
-                genre_link = ORGANIZED_DIR / "Genres" / parent / genre / instrument_folder / unique_name
-                self._create_link(source_path, genre_link)
-                symlinks_created.append(str(genre_link))
-        else:
-            # No genre detected, put in Other
-            genre_link = ORGANIZED_DIR / "Genres" / "Other" / instrument_folder / unique_name
-            self._create_link(source_path, genre_link)
-            symlinks_created.append(str(genre_link))
+        genre_str = ', '.join([g[1] for g in genres]) if genres else 'Other'
+        logger.info(f"Processed: {os.path.basename(source_str)} -> {category} ({'Loop' if is_loop else 'One-Shot'}) [{genre_str}]")
+        return unique_name, type_folder, category, genres
 
-        # Update state
-        self.state["files"][source_str] = symlinks_created
-        self._save_state()
+    def _link_files(self, jobs: list) -> list:
+        """Run _link_file for a chunk of (info, unique_name) jobs, returning results in order.
 
-        genre_str = ', '.join([g[1] for g in genres]) if genres else 'Other'
-        logger.info(f"Processed: {source_path.name} -> {category} ({'Loop' if is_loop else 'One-Shot'}) [{genre_str}]")
-        return True
+        A file that fails to link is logged and gets None, so it is retried on the next sync.
+        """
+        results = []
+        for info, unique_name in jobs:
+            try:
+                results.append(self._link_file(info, unique_name))
+            except OSError as e:
+                logger.error(f"Error linking {info.name}: {e}")
+                results.append(None)
+        return results
+
+    def _record_file(self, source_str: str, unique_name: str, type_folder: str, category: str, genres: list):
+        """Store how a linked source file was named and classified in state."""
+        if self.dry_run:
+            return
+        self.conn.execute("INSERT OR REPLACE INTO files (source, name, type, category, genres) "
+                          "VALUES (?, ?, ?, ?, ?)",
+                          (source_str, unique_name, type_folder, category, json.dumps(genres)))
 
     def remove_file(self, source_path: Path):
         """Remove symlinks when source file is deleted."""
         source_str = str(source_path)
 
-        if source_str not in self.state["files"]:
+        links = self._get_links(source_str)
+        if links is None:
             return
 
         if self.dry_run:
             logger.info(f"[DRY RUN] Would remove symlinks for: {source_path.name}")
             return
 
-        for link_path in self.state["files"][source_str]:
-            link = Path(link_path)
-            if link.is_symlink():
-                link.unlink()
-                logger.info(f"Removed symlink: {link.name}")
+        for link in links:
+            if os.path.islink(link):
+                os.unlink(link)
+                logger.info(f"Removed symlink: {os.path.basename(link)}")
 
-        del self.state["files"][source_str]
-        self._save_state()
+        self.conn.execute("DELETE FROM files WHERE source = ?", (source_str,))
 
-    def _create_link(self, source: Path, link: Path):
+    def _create_link(self, source: str, link: str):
         """Create hard link, handling existing files."""
-        import os
-        if link.exists() or link.is_symlink():
-            link.unlink()
-        os.link(source, link)
-
-    def _is_loop(self, path: str) -> bool:
+        # Links are usually new, so try first instead of stat-ing up front
+        try:
+            os.link(source, link)
+        except FileExistsError:
+            os.unlink(link)
+            os.link(source, link)
+        except FileNotFoundError:
+            # Output folder removed while running (a missing source fails again below)
+            os.makedirs(os.path.dirname(link), exist_ok=True)
+            os.link(source, link)
+
+    def _is_loop(self, info: _SampleInfo) -> bool:
         """Determine if sample is a loop based on folder path and filename."""
-        path_lower = path.lower()
-
         # Folder indicators (most reliable)
-        loop_patterns = ['/loops/', '/loop/', '/drum_loops/', '/synth_loops/',
-                        '/bass_loops/', '/percussion_loops/', '/vocal_loops/',
-                        '/fx_loops/', '/melodic_loops/', '/music_loops/',
-                        '/hat_loops/', '/kick_loops/', '/top_loops/']
-        oneshot_patterns = ['/one_shots/', '/one-shots/', '/oneshots/', '/one_shot/',
-                          '/hits/', '/drum_hits/', '/samples/', '/drum_one_shots/']
-
-        for p in loop_patterns:
-            if p in path_lower:
-                return True
-        for p in oneshot_patterns:
-            if p in path_lower:
-                return False
+        if LOOP_FOLDER_RE.search(info.path_lower):
+            return True
+        if ONESHOT_FOLDER_RE.search(info.path_lower):
+            return False
 
         # Filename indicators
-        filename = Path(path).stem.lower()
+        filename = info.stem_lower
         if '_loop' in filename or 'loop_' in filename:
             return True
         # BPM at start of filename usually indicates loop
-        if re.search(r'^\d{2,3}_', filename):
+        if BPM_PREFIX_RE.match(filename):
             return True
 
         return False
 
-    def _categorize(self, path: str, is_loop: bool) -> str:
+    def _categorize(self, info: _SampleInfo, is_loop: bool) -> str:
         """Categorize sample by instrument/type."""
-        path_obj = Path(path)
-
         # Build search text from multiple path components for better matching
         # Include: filename, parent folder, grandparent folder, and any folder after 'packs'
-        parts_to_search = [path_obj.stem]  # filename without extension
-
-        # Add parent folders (up to 4 levels, excluding common structural folders)
-        skip_folders = {'sounds', 'packs', 'splice', 'samples', 'audio'}
-        for parent in path_obj.parents:
-            if parent.name.lower() not in skip_folders and parent.name:
-                parts_to_search.append(parent.name)
-            if len(parts_to_search) >= 5:
-                break
-
-        search_text = ' '.join(parts_to_search).lower()
-
-        categories = LOOP_CATEGORIES if is_loop else ONESHOT_CATEGORIES
-
-        for category, patterns in categories.items():
-            for pattern in patterns:
-                if re.search(pattern, search_text, re.IGNORECASE):
-                    return category
-
-        return 'Other'
-
-    def _detect_genres(self, path: str) -> list:
+        folder_text = self._folder_search_text(info.folders)
+        search_text = f"{info.stem_lower} {folder_text}" if folder_text else info.stem_lower
+
+        matcher = LOOP_MATCHER if is_loop else ONESHOT_MATCHER
+        return matcher.first(search_text) or 'Other'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _folder_search_text(folders: tuple) -> str:
+        """Lowercased parent folder names used by _categorize."""
+        # Nearest parent folders first (up to 4 levels, excluding common structural folders)
+        parts_to_search = [name for name in reversed(folders)
+                           if name.lower() not in {'sounds', 'packs', 'splice', 'samples', 'audio'}][:4]
+        return ' '.join(parts_to_search).lower()
+
+    def _detect_genres(self, info: _SampleInfo) -> list:
         """Detect genres from pack name and path. Returns list of (parent, genre) tuples."""
-        path_obj = Path(path)
-        matched_genres = []
+        return list(self._folder_genres(info.pack_parts, info.folders))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _folder_genres(pack_parts: tuple, folders: tuple) -> tuple:
+        """Genre matches for a file's pack and folders, as (parent, genre) tuples."""
         # Build search text primarily from pack name and folder structure
-        parts_to_search = []
-
-        # Get pack name (most important for genre detection)
-        try:
-            parts = path_obj.parts
-            idx = parts.index('packs')
-            pack_name = parts[idx + 1]
-            parts_to_search.append(pack_name)
-            # Also include immediate subfolders of the pack
-            if idx + 2 < len(parts):
-                parts_to_search.append(parts[idx + 2])
-        except (ValueError, IndexError):
-            pass
+        # Pack name (most important for genre detection) and its immediate subfolder
+        parts_to_search = list(pack_parts)
 
         # Add some parent folders
-        for parent in path_obj.parents:
-            if parent.name and parent.name.lower() not in {'sounds', 'packs', 'splice', 'samples', 'audio', 'users', 'isaacfidler'}:
-                parts_to_search.append(parent.name)
+        for name in reversed(folders):
+            if name.lower() not in {'sounds', 'packs', 'splice', 'samples', 'audio', 'users', 'isaacfidler'}:
+                parts_to_search.append(name)
             if len(parts_to_search) >= 6:
                 break
 
         search_text = ' '.join(parts_to_search).lower()
 
-        # Check each genre category
-        for parent_category, genres in GENRE_CATEGORIES.items():
-            for genre, patterns in genres.items():
-                for pattern in patterns:
-                    if re.search(pattern, search_text, re.IGNORECASE):
-                        genre_tuple = (parent_category, genre)
-                        if genre_tuple not in matched_genres:
-                            matched_genres.append(genre_tuple)
-                        break  # Found a match for this genre, move to next genre
-
-        return matched_genres
-
-    def _generate_unique_name(self, source: Path) -> str:
-        """Generate unique filename with pack prefix to avoid collisions."""
-        parts = source.parts
-        try:
-            idx = parts.index('packs')
-            pack_name = parts[idx + 1]
-        except (ValueError, IndexError):
-            pack_name = "Unknown"
+        # Check every genre category
+        return tuple(GENRE_MATCHER.all(search_text))
+
+    def _generate_unique_name(self, info: _SampleInfo, reserved: set = frozenset()) -> str:
+        """Generate unique filename with pack prefix to avoid collisions.
+
+        Only called for files not in state yet; both callers check that first.
+        `reserved` holds names already handed out but not linked yet, casefolded
+        since the output folder may be on a case-insensitive filesystem (APFS).
+        """
+        pack_name = info.pack_parts[0] if info.pack_parts else "Unknown"
 
         # Sanitize pack name
-        safe_pack = re.sub(r'[^\w\-]', '_', pack_name)[:30]
-        base_name = f"{safe_pack}__{source.stem}{source.suffix}"
+        safe_pack = _safe_pack_name(pack_name)
+        base_name = f"{safe_pack}__{info.name}"
 
         # Check All/ for collisions
         target = ORGANIZED_DIR / "All" / base_name
-        if not target.exists() and str(source) not in self.state["files"]:
+        if base_name.casefold() not in reserved and not target.exists():
             return base_name
 
-        # Check if this is the same file (already processed)
-        if str(source) in self.state["files"]:
-            existing_links = self.state["files"][str(source)]
-            if existing_links:
-                return Path(existing_links[0]).name
-
-        # Add hash for collision
-        content_hash = hashlib.md5(source.read_bytes()).hexdigest()[:8]
-        return f"{safe_pack}__{source.stem}_{content_hash}{source.suffix}"
+        # Add hash for collision - a cheap fingerprint (size, mtime, first and
+        # last 4KB) is plenty to tell apart same-named files within one pack
+        stat = os.stat(info.source)
+        fingerprint = hashlib.blake2b(digest_size=4)
+        fingerprint.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        with open(info.source, 'rb') as f:
+            fingerprint.update(f.read(4096))
+            if stat.st_size > 4096:
+                f.seek(max(4096, stat.st_size - 4096))
+                fingerprint.update(f.read(4096))
+        content_hash = fingerprint.hexdigest()
+        stem, suffix = os.path.splitext(info.name)
+        return f"{safe_pack}__{stem}_{content_hash}{suffix}"
 
     def initial_sync(self):
         """Process all existing files."""
         logger.info("Starting initial sync...")
-        count = 0
-        total = 0
 
-        wav_files = list(SPLICE_PACKS_DIR.rglob("*.wav"))
+        wav_files = list(_iter_wav_files(str(SPLICE_PACKS_DIR)))
         total_files = len(wav_files)
 
-        for i, wav_file in enumerate(wav_files):
-            if self.process_file(wav_file):
-                count += 1
-            total += 1
-
-            # Progress update every 100 files
-            if total % 100 == 0:
-                logger.info(f"Progress: {total}/{total_files} files scanned, {count} new files processed")
-
+        # On a rerun nearly every file is known already, so fetch them all at
+        # once rather than querying per file
+        processed = {source for (source,) in self.conn.execute("SELECT source FROM files")}
+
+        # Names are handed out here, in order, so collisions resolve exactly as
+        # in a serial sync; the worker threads only categorize and link
+        reserved = set()
+        jobs = []
+        for wav_file in wav_files:
+            if wav_file in processed:
+                continue
+            info = _sample_info(wav_file)
+            try:
+                unique_name = self._generate_unique_name(info, reserved)
+            except FileNotFoundError:
+                logger.warning(f"Skipped missing file: {os.path.basename(wav_file)}")
+                continue
+            reserved.add(unique_name.casefold())
+            jobs.append((info, unique_name))
+        logger.info(f"Found {total_files} files, {len(jobs)} new")
+
+        count = self._link_jobs(jobs)
         logger.info(f"Initial sync complete: {count} new files processed out of {total_files} total")
         return count
 
+    def _link_jobs(self, jobs: list) -> int:
+        """Link and record (info, unique_name) jobs on the sync threads. Returns the files linked.
+
+        Ctrl+C (or SIGTERM) stops after the chunks in progress: files already
+        linked are recorded and committed, then KeyboardInterrupt is raised.
+        While the threads run the signal only sets a flag, as raising it at an
+        arbitrary point could leave a lock (e.g. logging's) held and hang them.
+        """
+        interrupted = threading.Event()
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                if signal.getsignal(signum) is signal.SIG_IGN:
+                    continue  # Ignored on purpose (nohup, background job); keep it that way
+                previous_handlers[signum] = signal.signal(signum, lambda *_: interrupted.set())
+
+        # Linking is mostly syscalls, so threads overlap well; state is only
+        # updated here on the calling thread as results come back in order.
+        # Files go out in chunks, as a future per file costs about as much
+        # as categorizing it
+        chunks = [jobs[i:i + SYNC_CHUNK_SIZE] for i in range(0, len(jobs), SYNC_CHUNK_SIZE)]
+        count = 0
+        done = 0
+        try:
+            with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+                futures = [pool.submit(self._link_files, chunk) for chunk in chunks]
+                try:
+                    for chunk, future in zip(chunks, futures):
+                        if interrupted.is_set():
+                            break
+                        for (info, _), result in zip(chunk, future.result()):
+                            if result is None:
+                                continue
+                            self._record_file(info.source, *result)
+                            count += 1
+
+                            # Progress update every 100 files
+                            if count % 100 == 0:
+                                logger.info(f"Progress: {count}/{len(jobs)} new files processed")
+
+                            if count % STATE_SAVE_INTERVAL == 0:
+                                self.save_state()
+                        done += 1
+                finally:
+                    # When stopping early, drop queued files but record the ones
+                    # already linked (re-recording a partly recorded chunk is
+                    # harmless), so the next run doesn't take their links for collisions
+                    for future in futures:
+                        future.cancel()  # Only queued chunks can be cancelled
+                    pool.shutdown()
+                    for chunk, future in zip(chunks[done:], futures[done:]):
+                        if future.cancelled():
+                            continue
+                        for (info, _), result in zip(chunk, future.result()):
+                            if result:
+                                self._record_file(info.source, *result)
+                                count += 1
+                    self.save_state()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        if interrupted.is_set():
+            logger.info(f"Sync interrupted: {count} new files processed and saved")
+            raise KeyboardInterrupt
+        return count
+
     def resync(self):
         """Force reprocess all files by clearing state."""
         logger.info("Clearing state and removing all links...")
 
         # Remove all existing links (symlinks and hard links)
-        for folder in ['All', 'One_Shots', 'Loops', 'Genres']:
-            folder_path = ORGANIZED_DIR / folder
-            if folder_path.exists():
-                for item in folder_path.rglob('*'):
-                    if item.is_file() or item.is_symlink():
-                        item.unlink()
+        if self.dry_run:
+            logger.info("[DRY RUN] Would remove all links")
+        else:
+            for folder in ['All', 'One_Shots', 'Loops', 'Genres']:
+                folder_path = ORGANIZED_DIR / folder
+                if folder_path.exists():
+                    for item in folder_path.rglob('*'):
+                        if item.is_file() or item.is_symlink():
+                            item.unlink()
 
-        # Clear state
-        self.state = {"files": {}}
-        self._save_state()
+        # Clear state (in a dry run, only the in-memory copy)
+        self.conn.execute("DELETE FROM files")
+        self.save_state()
 
         # Reprocess
         return self.initial_sync()
@@ -466,46 +980,29 @@ class SampleOrganizer:
     def show_stats(self):
         """Display categorization statistics."""
         stats = {
-            'One_Shots': {},
-            'Loops': {},
-            'Genres_Electronic': {},
-            'Genres_Live': {},
+            'One_Shots': Counter(),
+            'Loops': Counter(),
+            'Genres_Electronic': Counter(),
+            'Genres_Live': Counter(),
             'Genres_Other': 0,
             'Total': 0
         }
 
-        for source_path, links in self.state["files"].items():
-            stats['Total'] += 1
-            for link in links:
-                link_path = Path(link)
-                parts = link_path.parts
+        # Classification is stored per file, so SQLite does the counting;
+        # only the few distinct genre combinations are decoded here
+        for type_folder, category, count in self.conn.execute(
+                "SELECT type, category, COUNT(*) FROM files GROUP BY type, category"):
+            stats['Total'] += count
+            if type_folder in ('One_Shots', 'Loops'):
+                stats[type_folder][category] += count
 
-                try:
-                    org_idx = parts.index('Splice-Organized')
-                    if org_idx + 1 < len(parts):
-                        type_folder = parts[org_idx + 1]  # One_Shots, Loops, Genres, or All
-
-                        if type_folder == 'One_Shots' and org_idx + 2 < len(parts):
-                            category = parts[org_idx + 2]
-                            stats['One_Shots'][category] = stats['One_Shots'].get(category, 0) + 1
-
-                        elif type_folder == 'Loops' and org_idx + 2 < len(parts):
-                            category = parts[org_idx + 2]
-                            stats['Loops'][category] = stats['Loops'].get(category, 0) + 1
-
-                        elif type_folder == 'Genres' and org_idx + 2 < len(parts):
-                            parent = parts[org_idx + 2]  # Electronic, Live, or Other
-                            if parent == 'Electronic' and org_idx + 3 < len(parts):
-                                genre = parts[org_idx + 3]
-                                stats['Genres_Electronic'][genre] = stats['Genres_Electronic'].get(genre, 0) + 1
-                            elif parent == 'Live' and org_idx + 3 < len(parts):
-                                genre = parts[org_idx + 3]
-                                stats['Genres_Live'][genre] = stats['Genres_Live'].get(genre, 0) + 1
-                            elif parent == 'Other':
-                                stats['Genres_Other'] += 1
-
-                except ValueError:
-                    continue
+        for genres, count in self.conn.execute("SELECT genres, COUNT(*) FROM files GROUP BY genres"):
+            genres = json.loads(genres)
+            for parent, genre in genres:
+                if parent in ('Electronic', 'Live'):
+                    stats[f'Genres_{parent}'][genre] += count
+            if not genres:
+                stats['Genres_Other'] += count
 
         print("\n=== Splice Organizer Statistics ===\n")
         print(f"Total samples: {stats['Total']}\n")
@@ -534,45 +1031,80 @@ class SampleOrganizer:
         logger.info("Validating symlinks...")
         removed = 0
 
-        sources_to_remove = []
-
-        for source_path, links in self.state["files"].items():
-            source = Path(source_path)
-            if not source.exists():
-                # Source file was deleted, remove symlinks
-                for link_path in links:
-                    link = Path(link_path)
-                    if link.is_symlink():
-                        link.unlink()
-                        removed += 1
-                sources_to_remove.append(source_path)
+        # Only rows whose source is gone need their links rebuilt
+        sources_to_remove = [source_path for (source_path,) in self.conn.execute("SELECT source FROM files")
+                             if not os.path.exists(source_path)]
 
         for source_path in sources_to_remove:
-            del self.state["files"][source_path]
+            # Source file was deleted, remove symlinks
+            for link_path in self._get_links(source_path):
+                if os.path.islink(link_path):
+                    os.unlink(link_path)
+                    removed += 1
+
+        self.conn.executemany("DELETE FROM files WHERE source = ?",
+                              ((source_path,) for source_path in sources_to_remove))
 
-        self._save_state()
+        self.save_state()
         logger.info(f"Validation complete: removed {removed} broken symlinks")
 
 
-class SpliceEventHandler(FileSystemEventHandler):
-    """Handle file system events from watchdog."""
+class SpliceEventHandler(PatternMatchingEventHandler):
+    """Handle file system events from watchdog.
+
+    Only .wav files (any case) reach the handler; directories and other files
+    are filtered out by watchdog. Events are queued and handled in batches on
+    a worker thread, so a pack download of hundreds of files commits state
+    once instead of per file.
+    """
 
     def __init__(self, organizer: SampleOrganizer):
+        super().__init__(patterns=['*.wav'], ignore_directories=True, case_sensitive=False)
         self.organizer = organizer
+        self._events = queue.Queue()  # (created, path) in arrival order; None stops the worker
+        self._worker = threading.Thread(target=self._process_events, daemon=True)
+        self._worker.start()
 
     def on_created(self, event):
-        if event.is_directory:
-            return
-        path = Path(event.src_path)
-        if path.suffix.lower() == '.wav':
-            self.organizer.process_file(path)
+        self._events.put((True, Path(event.src_path)))
 
     def on_deleted(self, event):
-        if event.is_directory:
-            return
-        path = Path(event.src_path)
-        if path.suffix.lower() == '.wav':
-            self.organizer.remove_file(path)
+        self._events.put((False, Path(event.src_path)))
+
+    def stop(self):
+        """Handle any queued events, then stop the worker."""
+        self._events.put(None)
+        self._worker.join()
+
+    def _process_events(self):
+        running = True
+        while running:
+            batch = [self._events.get()]
+            # Keep collecting until the burst goes quiet (or gets large)
+            while batch[-1] is not None and len(batch) < EVENT_BATCH_MAX:
+                try:
+                    batch.append(self._events.get(timeout=EVENT_BATCH_DELAY))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                running = False
+                batch.pop()
+
+            for created, path in batch:
+                try:
+                    if created:
+                        self.organizer.process_file(path)
+                    else:
+                        self.organizer.remove_file(path)
+                except Exception:
+                    logger.exception(f"Error handling {path}")
+            if batch:
+                try:
+                    self.organizer.save_state()
+                except Exception:
+                    # E.g. database locked by a --resync; the changes stay pending
+                    # and go out with the next batch's commit
+                    logger.exception("Error saving state")
 
 
 def setup_logging(verbose: bool = False):
@@ -606,10 +1138,15 @@ def main():
                        help='Preview changes without creating symlinks')
     parser.add_argument('--no-watch', action='store_true',
                        help='Run initial sync only, do not watch for changes')
+    parser.add_argument('--poll-interval', type=float, metavar='SECONDS',
+                       help='Watch by polling every SECONDS instead of native file events '
+                            '(for network drives, where native events are not delivered)')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Enable verbose logging')
 
     args = parser.parse_args()
+    if args.poll_interval is not None and not args.poll_interval > 0:  # Also rejects nan
+        parser.error("--poll-interval must be greater than 0")
 
     setup_logging(args.verbose)
 
@@ -627,18 +1164,28 @@ def main():
         organizer.validate()
         return
 
-    if args.resync:
-        organizer.resync()
-        if args.no_watch:
-            return
-    else:
-        organizer.initial_sync()
-        if args.no_watch:
-            return
+    # Stop syncing or watching on SIGTERM (e.g. a service manager) the same way
+    # as on Ctrl+C, so state is saved - unless SIGTERM was ignored on purpose
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_IGN:
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        if args.resync:
+            organizer.resync()
+        else:
+            organizer.initial_sync()
+    except KeyboardInterrupt:
+        logger.info("Stopping...")
+        sys.exit(130)  # Unfinished sync: don't report success
+    if args.no_watch:
+        return
 
     # Start watching
     event_handler = SpliceEventHandler(organizer)
-    observer = Observer()
+    if args.poll_interval is not None:
+        observer = PollingObserver(timeout=args.poll_interval)
+    else:
+        observer = Observer()
     observer.schedule(event_handler, str(SPLICE_PACKS_DIR), recursive=True)
     observer.start()
 
@@ -652,6 +1199,7 @@ def main():
         observer.stop()
 
     observer.join()
+    event_handler.stop()
 
 
 if __name__ == "__main__":